@@ -0,0 +1,248 @@
+"""
+Shared pytest fixtures for the litert-lm MCP tests.
+
+A single litert-lm MCP server is launched over stdio for the whole test run,
+so every test reuses one subprocess and one initialize handshake. Download
+tests get a server of their own instead (see download_session).
+"""
+
+import asyncio
+import os
+import pathlib
+import socket
+import urllib.parse
+from contextlib import AsyncExitStack, asynccontextmanager
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from mcp import ClientSession, StdioServerParameters, types
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
+# Resolved once so the tests can run from any working directory
+SERVER_BIN = (pathlib.Path(__file__).parent / "../../target/release/litert-lm").resolve()
+SERVER_PARAMS = StdioServerParameters(
+    command=str(SERVER_BIN),
+    args=["mcp", "--transport", "stdio"],
+)
+
+# Start with: ../../target/release/litert-lm mcp --transport sse --port 3000
+SSE_URL = "http://localhost:3000/sse"
+
+
+class ResourceSubscription:
+    """A subscribed resource, driven by the server's resources/updated notifications."""
+
+    def __init__(self, session, uri):
+        self.session = session
+        self.uri = uri
+        self.notified = asyncio.Queue()
+        self._last_text = None
+        self._last_parsed = None
+
+    async def read(self):
+        """Read the resource and parse its JSON payload.
+
+        The parsed payload is reused when the server returns the same text
+        as the previous read.
+        """
+        resource_content = await self.session.read_resource(self.uri)
+        text = resource_content.contents[0].text
+        if text != self._last_text:
+            self._last_parsed = orjson.loads(text)
+            self._last_text = text
+        return self._last_parsed
+
+    async def updates(self, timeout):
+        """Yield the resource's current state each time the server reports a change.
+
+        Stops once no notification has arrived for `timeout` seconds, or
+        waits indefinitely when `timeout` is None.
+        Notifications that pile up while the caller is busy are coalesced
+        into a single read.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self.notified.get(), timeout)
+            except TimeoutError:
+                return
+            while not self.notified.empty():
+                self.notified.get_nowait()
+            yield await self.read()
+
+
+def _keepalive_http_client(headers=None, timeout=None, auth=None):
+    """HTTP client for the SSE transport that keeps idle connections open."""
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        auth=auth,
+        follow_redirects=True,
+        limits=httpx.Limits(keepalive_expiry=60),
+    )
+
+
+async def _hold_session(transport, ready, closing, message_handler=None):
+    """Enter the transport and session, then keep them open until closing is set."""
+    async with AsyncExitStack() as stack:
+        read, write = await stack.enter_async_context(transport)
+        session = await stack.enter_async_context(
+            ClientSession(read, write, message_handler=message_handler)
+        )
+        await session.initialize()
+        ready.set_result(session)
+        await closing.wait()
+
+
+@asynccontextmanager
+async def _shared_session(transport, message_handler=None):
+    """Open an initialized ClientSession over transport for the duration of the block.
+
+    The SDK's anyio cancel scopes must be exited by the task that entered them,
+    and pytest-asyncio tears fixtures down from a different task than it set
+    them up in, so the contexts are owned by a dedicated task instead.
+    """
+    ready = asyncio.get_running_loop().create_future()
+    closing = asyncio.Event()
+    owner = asyncio.create_task(_hold_session(transport, ready, closing, message_handler))
+    owner.add_done_callback(
+        lambda task: ready.done() or ready.set_exception(
+            task.exception() or RuntimeError("MCP session closed during setup")
+        )
+    )
+
+    try:
+        yield await ready
+    finally:
+        closing.set()
+        await owner
+
+
+def _route_resource_updates(subscriptions):
+    """Message handler that hands resources/updated notifications to their subscription."""
+
+    async def on_message(message):
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ResourceUpdatedNotification
+        ):
+            subscription = subscriptions.get(str(message.root.params.uri))
+            if subscription is not None:
+                subscription.notified.put_nowait(message.root.params)
+
+    return on_message
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run every test and fixture on a uvloop event loop."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def hf_token():
+    """Hugging Face token from HF_TOKEN, skipping the test when it is unset.
+
+    Session-scoped so that, listed first, it is resolved before the server
+    is spawned.
+    """
+    token = os.environ.get("HF_TOKEN")
+    if not token:
+        pytest.skip(
+            "HF_TOKEN not set. Get a token from "
+            "https://huggingface.co/settings/tokens and export HF_TOKEN=hf_..."
+        )
+    return token
+
+
+@pytest.fixture(scope="session")
+def subscriptions():
+    """Active resource subscriptions, keyed by URI."""
+    return {}
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_session(subscriptions):
+    """Connected and initialized MCP session shared by all tests."""
+    if not SERVER_BIN.exists():
+        pytest.skip(f"{SERVER_BIN} not found. Build it with: cargo build --release")
+
+    on_message = _route_resource_updates(subscriptions)
+    async with _shared_session(stdio_client(SERVER_PARAMS), on_message) as session:
+        print("✓ Connected to litert-lm MCP server")
+        yield session
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def download_session(subscriptions):
+    """MCP session on a dedicated stdio server, for a single download test.
+
+    The SDK does not tell the server when a call_tool task is cancelled, so a
+    pull abandoned on the shared session would keep running. Closing this
+    session stops the server, and with it any download still in flight.
+    """
+    if not SERVER_BIN.exists():
+        pytest.skip(f"{SERVER_BIN} not found. Build it with: cargo build --release")
+
+    on_message = _route_resource_updates(subscriptions)
+    async with _shared_session(stdio_client(SERVER_PARAMS), on_message) as session:
+        print("✓ Started a dedicated litert-lm MCP server")
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sse_session():
+    """Connected and initialized MCP session over SSE, shared by all tests.
+
+    Skips when no server is listening on SSE_URL.
+    """
+    # Probe the port first; a failed connect inside sse_client() leaves the
+    # SDK's memory streams unclosed
+    url = urllib.parse.urlsplit(SSE_URL)
+    try:
+        socket.create_connection((url.hostname, url.port), timeout=1).close()
+    except OSError:
+        pytest.skip(
+            f"No MCP server at {SSE_URL}. Start one with: "
+            "../../target/release/litert-lm mcp --transport sse --port 3000"
+        )
+
+    transport = sse_client(SSE_URL, httpx_client_factory=_keepalive_http_client)
+    async with _shared_session(transport) as session:
+        print(f"✓ Connected to MCP server via SSE at {SSE_URL}")
+        yield session
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def subscribe(subscriptions):
+    """Subscribe to resources for a single test, unsubscribing on teardown.
+
+    Returns an async callable that takes a session and a resource URI and
+    returns its ResourceSubscription. Request this fixture after the session
+    fixture so it is torn down while the session is still open.
+    """
+    subscribed = []
+
+    async def _subscribe(session, uri):
+        subscriptions[uri] = ResourceSubscription(session, uri)
+        try:
+            await session.subscribe_resource(uri)
+        except Exception:
+            del subscriptions[uri]
+            raise
+        subscribed.append(subscriptions[uri])
+        return subscriptions[uri]
+
+    yield _subscribe
+
+    for subscription in subscribed:
+        del subscriptions[subscription.uri]
+        await subscription.session.unsubscribe_resource(subscription.uri)
+
@@ -0,0 +1,125 @@
+"""
+Smoke tests for the litert-lm MCP server over stdio and SSE transports.
+
+Every case runs against the shared session for its transport (see
+conftest.py), so the module spawns one server and performs one handshake per
+transport. SSE cases are skipped unless a server is listening:
+
+    ../../target/release/litert-lm mcp --transport sse --port 3000
+
+The completion is marked slow and only runs when selected: litert-lm does
+not yet honour max_tokens, so it is always a full-length generation.
+
+Usage:
+    uv run pytest test_mcp_smoke.py -s
+    uv run pytest test_mcp_smoke.py -s -m slow
+"""
+
+import asyncio
+import time
+
+import pytest
+
+# Model used for completions (must already be downloaded)
+MODEL = "gemma-3n-E4B"
+
+EXPECTED_TOOLS = {
+    "list_models",
+    "pull_model",
+    "remove_model",
+    "run_completion",
+    "check_download_progress",
+}
+
+
+@pytest.fixture(params=["mcp_session", "sse_session"], ids=["stdio", "sse"])
+def session(request):
+    """Shared MCP session for each transport under test."""
+    return request.getfixturevalue(request.param)
+
+
+async def test_ping(session):
+    # initialize() has already completed; a ping confirms the server is responsive
+    await asyncio.wait_for(session.send_ping(), timeout=2.0)
+
+
+async def test_list_tools(session):
+    print("\n→ Listing tools...")
+    tools = await session.list_tools()
+    print(f"✓ Found {len(tools.tools)} tools")
+    for tool in tools.tools:
+        print(f"  - {tool.name}: {tool.description}")
+
+    assert EXPECTED_TOOLS <= {t.name for t in tools.tools}
+
+
+async def test_concurrent_requests(session):
+    # These calls are independent, so issue them concurrently
+    print("\n→ Listing tools, models and resources...")
+    tools, downloaded, all_models, resources = await asyncio.gather(
+        session.list_tools(),
+        session.call_tool("list_models", {"show_all": False}),
+        session.call_tool("list_models", {"show_all": True}),
+        session.list_resources(),
+    )
+
+    print(f"✓ Available tools: {[t.name for t in tools.tools]}")
+    print(f"\n✓ Downloaded models:\n{downloaded.content[0].text}")
+    print(f"\n✓ All models:\n{all_models.content[0].text}")
+    print(f"\n✓ Found {len(resources.resources)} resources")
+    for resource in resources.resources[:3]:  # Show first 3
+        print(f"  - {resource.name}")
+
+    assert not downloaded.isError
+    assert not all_models.isError
+
+
+@pytest.mark.parametrize(
+    "tool,args",
+    [
+        pytest.param("list_models", {"show_all": False}, id="downloaded-models"),
+        pytest.param("list_models", {"show_all": True}, id="all-models"),
+        # A single completion case: litert-lm ignores max_tokens and
+        # temperature, so a short and a full-length case would generate the
+        # same output twice. Split them again once the server honours them.
+        pytest.param(
+            "run_completion",
+            {
+                "model": MODEL,
+                "prompt": "What is MCP?",
+                "max_tokens": 2048,
+                "temperature": 0.7
+            },
+            id="completion",
+            marks=pytest.mark.slow,
+        ),
+    ],
+)
+async def test_call_tool(session, tool, args):
+    print(f"\n→ Calling {tool} with {args}...")
+    started = time.perf_counter()
+    first_progress = None
+
+    async def on_progress(progress, total, message):
+        # Print partial output as soon as the server reports it
+        nonlocal first_progress
+        if first_progress is None:
+            first_progress = time.perf_counter() - started
+        if message:
+            print(message, end="", flush=True)
+
+    result = await session.call_tool(tool, args, progress_callback=on_progress)
+
+    if first_progress is not None:
+        print(f"\n✓ First progress update after {first_progress * 1000:.0f} ms")
+
+    response = result.content[0].text
+    print(f"\n{'='*60}")
+    print("Response:")
+    print(f"{'='*60}")
+    print(response)
+    print(f"{'='*60}")
+
+    assert not result.isError
+    assert response
+